@@ -5,7 +5,7 @@ from sre_core.init_app import init_app
 st.set_page_config(page_title="SRE Maturity", layout="wide")
 
 # Init shared state, no sidebar controls
-init_app(show_sidebar_controls=False)
+init_app(show_sidebar_controls=False, page="Home")
 
 # Main welcome text
 st.title("SRE Maturity Assessment")
@@ -4,7 +4,7 @@ from sre_core.persistence import save_responses
 from sre_core.init_app import init_app
 
 # Initialise app without extra sidebar controls
-init_app(show_sidebar_controls=True)
+init_app(show_sidebar_controls=True, page="Assessment")
 
 st.title("SRE Maturity Assessment")
 
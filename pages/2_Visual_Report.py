@@ -6,16 +6,18 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from sre_core.init_app import init_app
-from sre_core import scoring, plotting
-from sre_core.constants import LEVELS
+from sre_core.instrumentation import timed
+from sre_core import scoring, plotting, vega_charts
+from sre_core.constants import LEVELS, CHART_BACKEND, RADAR_MAX_SPOKES, RADAR_LOD_MODE
 from sre_core.gauges import (
     stage_completion_from,
+    build_status_map,
     grid_from_completion,
     ring_maturity_by_stage,
 )
 
 # No sidebar controls on report pages
-init_app(show_sidebar_controls=False)
+init_app(show_sidebar_controls=False, page="Visual Report")
 
 st.title("SRE Maturity Visual Report")
 
@@ -30,43 +32,41 @@ if df.empty:
     st.info("No responses yet.")
     st.stop()
 
-# ---------- Radar sizing (match PDF style) ----------
-# We'll compute a shared adaptive size based on capability count (same as PDF)
-# but let users increase it via an optional slider cap.
-slider_size = st.sidebar.slider("Max radar size (inches)", min_value=6, max_value=14, value=10)
-
-# ---------- Radar by Stage ----------
-radar_stage = df.groupby(["Product", "Stage"])["Score"].mean().reset_index()
-labels_stage = sorted(radar_stage["Stage"].unique().tolist())
-
-# Determine shared size using capability count (like PDF)
-labels_cap_for_size = df["Capability"].unique().tolist()
-cap_count = max(1, len(labels_cap_for_size))
-shared_size = (
-    7.5 if cap_count <= 24 else
-    9.5 if cap_count <= 48 else
-    12.5 if cap_count <= 80 else
-    14.0
+# Client-side charts: ship compact JSON, the browser handles resize/hover.
+use_vega = CHART_BACKEND == "vega-lite"
+
+labels_stage, series_stage = scoring.radar_series(df, "Stage")
+labels_cap, series_cap = scoring.radar_series(df, "Capability")
+
+# Level of detail: large catalogs get an aggregated capability radar plus
+# per-stage drill-downs, so spoke count (and render cost) stays bounded.
+lod = plotting.radar_level_of_detail(
+    labels_cap, series_cap, dict(zip(df["Capability"], df["Stage"])),
+    max_spokes=RADAR_MAX_SPOKES, mode=RADAR_LOD_MODE,
 )
-radar_size = min(max(shared_size, 6.0), float(slider_size))
-
-fig1, ax1 = plt.subplots(figsize=(radar_size, radar_size), subplot_kw=dict(polar=True))
-for prod in radar_stage["Product"].unique():
-    vals = (
-        radar_stage[radar_stage["Product"] == prod]
-        .set_index("Stage")
-        .reindex(labels_stage)["Score"]
-        .fillna(0)
-        .tolist()
-    )
-    plotting.plot_radar(ax1, labels_stage, vals, label=prod, y_max=len(LEVELS))
-ax1.set_title("Average score by Stage", pad=26, fontsize=12)
-# Legend centered above, hide when only one series
-handles, labels = ax1.get_legend_handles_labels()
-if len(handles) > 1:
-    ax1.legend(loc="upper center", bbox_to_anchor=(0.5, 1.12), ncol=2, fontsize=8, frameon=False)
-elif ax1.legend_:
-    ax1.legend_.remove()
+if not lod.aggregated:
+    cap_title = "Average score by Capability"
+elif RADAR_LOD_MODE == "variance":
+    cap_title = f"Average score by Capability (top {len(lod.labels)} by variance)"
+else:
+    cap_title = "Average score by Capability (grouped by Stage)"
+drill_stage = None
+if lod.aggregated:
+    drill_stage = st.sidebar.selectbox("Capability radar: drill down into stage", list(lod.drilldowns))
+
+@timed("page.render_fig")
+def _render_fig(fig):
+    try:
+        st.pyplot(fig, width='stretch')
+    except TypeError:
+        st.pyplot(fig, use_container_width=True, clear_figure=True)
+
+@timed("page.render_spec")
+def _render_spec(spec):
+    try:
+        st.vega_lite_chart(spec, width='stretch')
+    except TypeError:
+        st.vega_lite_chart(spec, use_container_width=True)
 
 # Axis-aligned labels (match PDF)
 def _align_polar_labels(ax):
@@ -84,49 +84,56 @@ def _align_polar_labels(ax):
         lab.set_ha(ha)
         lab.set_va('center')
 
-stage_fs = 9 if len(labels_stage) <= 10 else 8 if len(labels_stage) <= 16 else 7
-ax1.tick_params(axis='x', labelsize=stage_fs, pad=6)
-_align_polar_labels(ax1)
-fig1.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.84])
-
-def _render_fig(fig):
-    try:
-        st.pyplot(fig, width='stretch')
-    except TypeError:
-        st.pyplot(fig, use_container_width=True, clear_figure=True)
-
-with st.expander("Radar by Stage", expanded=True):
-    _render_fig(fig1)
-
-# ---------- Radar by Capability ----------
-radar_cap = df.groupby(["Product", "Capability"])["Score"].mean().reset_index()
-labels_cap = sorted(radar_cap["Capability"].unique().tolist())
-
-fig2, ax2 = plt.subplots(figsize=(radar_size, radar_size), subplot_kw=dict(polar=True))
-for prod in radar_cap["Product"].unique():
-    vals = (
-        radar_cap[radar_cap["Product"] == prod]
-        .set_index("Capability")
-        .reindex(labels_cap)["Score"]
-        .fillna(0)
-        .tolist()
-    )
-    plotting.plot_radar(ax2, labels_cap, vals, label=prod, y_max=len(LEVELS))
-ax2.set_title("Average score by Capability", pad=26, fontsize=12)
-handles2, labels2 = ax2.get_legend_handles_labels()
-if len(handles2) > 1:
-    ax2.legend(loc="upper center", bbox_to_anchor=(0.5, 1.12), ncol=2, fontsize=8, frameon=False)
-elif ax2.legend_:
-    ax2.legend_.remove()
-
-cap_count2 = max(1, len(labels_cap))
-cap_fs = 9 if cap_count2 <= 12 else 8 if cap_count2 <= 24 else 7 if cap_count2 <= 36 else 6 if cap_count2 <= 60 else 5
-ax2.tick_params(axis='x', labelsize=cap_fs, pad=6)
-_align_polar_labels(ax2)
-fig2.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.84])
-
-with st.expander("Radar by Capability", expanded=True):
-    _render_fig(fig2)
+@timed("page.radar_figure")
+def _radar_figure(labels, series, title, size, label_fs):
+    fig, ax = plt.subplots(figsize=(size, size), subplot_kw=dict(polar=True))
+    for prod, vals in series.items():
+        plotting.plot_radar(ax, labels, vals, label=prod, y_max=len(LEVELS))
+    ax.set_title(title, pad=26, fontsize=12)
+    # Legend centered above, hide when only one series
+    handles, _labels = ax.get_legend_handles_labels()
+    if len(handles) > 1:
+        ax.legend(loc="upper center", bbox_to_anchor=(0.5, 1.12), ncol=2, fontsize=8, frameon=False)
+    elif ax.legend_:
+        ax.legend_.remove()
+    ax.tick_params(axis='x', labelsize=label_fs, pad=6)
+    _align_polar_labels(ax)
+    fig.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.84])
+    return fig
+
+if use_vega:
+    with st.expander("Radar by Stage", expanded=True):
+        _render_spec(vega_charts.radar_spec(labels_stage, series_stage, len(LEVELS), "Average score by Stage"))
+    with st.expander("Radar by Capability", expanded=True):
+        _render_spec(vega_charts.radar_spec(lod.labels, lod.series, len(LEVELS), cap_title))
+        if drill_stage:
+            d_labels, d_series = lod.drilldowns[drill_stage]
+            _render_spec(vega_charts.radar_spec(d_labels, d_series, len(LEVELS), f"{drill_stage}: score by Capability"))
+else:
+    # ---------- Radar sizing (match PDF style) ----------
+    # We'll compute a shared adaptive size based on capability count (same as PDF)
+    # but let users increase it via an optional slider cap.
+    slider_size = st.sidebar.slider("Max radar size (inches)", min_value=6, max_value=14, value=10)
+    # Sized by drawn spokes (bounded by the LOD), not by catalog size
+    radar_size = min(max(plotting.radar_size_for(len(lod.labels)), 6.0), float(slider_size))
+
+    # ---------- Radar by Stage ----------
+    stage_fs = 9 if len(labels_stage) <= 10 else 8 if len(labels_stage) <= 16 else 7
+    fig1 = _radar_figure(labels_stage, series_stage, "Average score by Stage", radar_size, stage_fs)
+    with st.expander("Radar by Stage", expanded=True):
+        _render_fig(fig1)
+
+    # ---------- Radar by Capability ----------
+    fig2 = _radar_figure(lod.labels, lod.series, cap_title, radar_size, plotting.radar_label_fontsize(len(lod.labels)))
+    with st.expander("Radar by Capability", expanded=True):
+        _render_fig(fig2)
+        if drill_stage:
+            d_labels, d_series = lod.drilldowns[drill_stage]
+            fig_d = _radar_figure(
+                d_labels, d_series, f"{drill_stage}: score by Capability",
+                min(plotting.radar_size_for(len(d_labels)), radar_size), plotting.radar_label_fontsize(len(d_labels)),
+            )
+            _render_fig(fig_d)
 
 # ---------- Stage Completion Half-Donuts ----------
 st.markdown("### Stage Completion Overview")
@@ -141,54 +148,36 @@ else:
         selected_product,
         LEVELS,
     )
-    # Avoid double-render inside grid_from_completion by disabling auto-show
-    fig_g, _axes = grid_from_completion(completion, cols=5, show=False)
-    _render_fig(fig_g)
+    if use_vega:
+        _render_spec(vega_charts.donut_grid_spec(completion, cols=5))
+    else:
+        # Avoid double-render inside grid_from_completion by disabling auto-show
+        fig_g, _axes = grid_from_completion(completion, cols=5, show=False)
+        _render_fig(fig_g)
 
 # ---------- Circular “degree of implementation” chart ----------
 st.markdown("### Degree of Implementation (Maturity by Stage)")
 
 if selected_product:
-    # Build tri-state status per (stage, level): 'not' | 'partial' | 'completed'
-    status_map = {}
-    prod_res = (st.session_state.responses_all or {}).get(selected_product, {}) or {}
+    # Tri-state status per (stage, level): 'not' | 'partial' | 'completed'
     items = st.session_state.maturity_items or []
-
-    by_stage = {}
-    for it in items:
-        by_stage.setdefault(it["Stage"], []).append(it)
-
-    for stage, caps in by_stage.items():
-        for lvl in LEVELS:
-            total = 0
-            completed = 0
-            partial = 0
-            for it in caps:
-                cap_res = prod_res.get(it["Capability"], {}) or {}
-                status = cap_res.get(lvl, "Not achieved")
-                total += 1
-                if status == "Completed":
-                    completed += 1
-                elif status == "Partially achieved":
-                    partial += 1
-            if total and completed == total:
-                status_map[(stage, lvl)] = "completed"
-            elif (completed > 0) or (partial > 0):
-                status_map[(stage, lvl)] = "partial"
-            else:
-                status_map[(stage, lvl)] = "not"
-
-    stages_order = sorted(by_stage.keys())
-
-    ring_size = st.sidebar.slider("Circular chart size (inches)", 8, 14, 10)
-    # Rotate specific labels by +190 degrees (previous +100 needed +90 more)
-    label_overrides = {"Develop": 190, "Observe": 190, "Secure": 190, "Test": 190, "tests": 190, "Tests": 190}
-    fig_ring = ring_maturity_by_stage(
-        stages=stages_order,
-        levels=LEVELS,
-        status_map=status_map,
-        label_rotation_overrides=label_overrides,
-        figsize=(ring_size, ring_size),
-    )
-    with st.expander("Identification of the degree of the implementation (Maturity by Stage)", expanded=True):
-        _render_fig(fig_ring)
+    prod_res = (st.session_state.responses_all or {}).get(selected_product, {}) or {}
+    status_map = build_status_map(items, prod_res, LEVELS)
+    stages_order = sorted({it["Stage"] for it in items})
+
+    if use_vega:
+        with st.expander("Identification of the degree of the implementation (Maturity by Stage)", expanded=True):
+            _render_spec(vega_charts.ring_spec(stages_order, LEVELS, status_map))
+    else:
+        ring_size = st.sidebar.slider("Circular chart size (inches)", 8, 14, 10)
+        # Rotate specific labels by +190 degrees (previous +100 needed +90 more)
+        label_overrides = {"Develop": 190, "Observe": 190, "Secure": 190, "Test": 190, "tests": 190, "Tests": 190}
+        fig_ring = ring_maturity_by_stage(
+            stages=stages_order,
+            levels=LEVELS,
+            status_map=status_map,
+            label_rotation_overrides=label_overrides,
+            figsize=(ring_size, ring_size),
+        )
+        with st.expander("Identification of the degree of the implementation (Maturity by Stage)", expanded=True):
+            _render_fig(fig_ring)
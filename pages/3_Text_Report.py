@@ -2,7 +2,7 @@ import streamlit as st
 from sre_core.init_app import init_app
 from sre_core import formatting
 
-init_app(show_sidebar_controls=False)
+init_app(show_sidebar_controls=False, page="Text Report")
 
 st.title("SRE Maturity Text Report")
 
@@ -4,10 +4,11 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from sre_core.init_app import init_app
+from sre_core.instrumentation import timed
 from sre_core import scoring, plotting, pdf_report
-from sre_core.constants import LEVELS
+from sre_core.constants import LEVELS, RADAR_MAX_SPOKES, RADAR_LOD_MODE
 
-init_app(show_sidebar_controls=False)
+init_app(show_sidebar_controls=False, page="PDF Report")
 st.title("SRE Maturity PDF Report")
 
 # Guards
@@ -44,15 +45,17 @@ title_pad_stage = 16
 title_fs_cap = 12
 title_pad_cap = 28
 
-# Determine a shared size for both radars (symmetry)
-cap_count = max(1, len(pdf_df["Capability"].unique().tolist()))
-shared_size = (
-    7.5 if cap_count <= 24 else
-    9.5 if cap_count <= 48 else
-    12.5 if cap_count <= 80 else
-    14.0
+# Capability radar level of detail: past RADAR_MAX_SPOKES capabilities the
+# radar is aggregated and per-stage drill-downs are added to the PDF.
+cap_labels, cap_series = scoring.radar_series(pdf_df, "Capability")
+lod = plotting.radar_level_of_detail(
+    cap_labels, cap_series, dict(zip(pdf_df["Capability"], pdf_df["Stage"])),
+    max_spokes=RADAR_MAX_SPOKES, mode=RADAR_LOD_MODE,
 )
 
+# Determine a shared size for both radars (symmetry), bounded by drawn spokes
+shared_size = plotting.radar_size_for(len(lod.labels))
+
 fig1, ax1 = plt.subplots(figsize=(shared_size, shared_size), subplot_kw=dict(polar=True))
 plotting.plot_radar(ax1, stages if stages else ["N/A"], stage_vals if stage_vals else [0.0], label="Stage")
 ax1.set_title("Average score by Stage", pad=title_pad_stage, fontsize=title_fs_stage)
@@ -85,6 +88,7 @@ def _align_polar_labels(ax):
 _align_polar_labels(ax1)
 # Reserve extra top space for the title/legend
 fig1.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.92])
+@timed("page.render_fig")
 def _render_fig(fig):
     try:
         st.pyplot(fig, width='stretch')
@@ -94,28 +98,42 @@ def _render_fig(fig):
 _render_fig(fig1)
 
 # Radar by Capability
-caps = sorted(pdf_df["Capability"].unique().tolist())
-cap_vals = [
-    float(pdf_df[pdf_df["Capability"] == c]["Score"].mean()) if not pdf_df[pdf_df["Capability"] == c].empty else 0.0
-    for c in caps
-]
-cap_count = max(1, len(caps))
-fig2, ax2 = plt.subplots(figsize=(shared_size, shared_size), subplot_kw=dict(polar=True))
-plotting.plot_radar(ax2, caps if caps else ["N/A"], cap_vals if cap_vals else [0.0], label="Capability")
-ax2.set_title("Average score by Capability", pad=title_pad_cap, fontsize=title_fs_cap)
-if caps:
-    handles, labels = ax2.get_legend_handles_labels()
-    if len(handles) > 1:
-        ax2.legend(loc="upper center", bbox_to_anchor=(0.5, 1.12), ncol=2, fontsize=8, frameon=False)
-    elif ax2.legend_:
-        ax2.legend_.remove()
-cap_fs = 9 if cap_count <= 12 else 8 if cap_count <= 24 else 7 if cap_count <= 36 else 6 if cap_count <= 60 else 5
-ax2.tick_params(axis='x', labelsize=cap_fs, pad=6)
-
-_align_polar_labels(ax2)
-fig2.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.82])
+@timed("page.cap_radar")
+def _cap_radar(labels, vals, title, size):
+    fig, ax = plt.subplots(figsize=(size, size), subplot_kw=dict(polar=True))
+    plotting.plot_radar(ax, labels if labels else ["N/A"], vals if vals else [0.0], label="Capability")
+    ax.set_title(title, pad=title_pad_cap, fontsize=title_fs_cap)
+    if labels:
+        handles, _labels = ax.get_legend_handles_labels()
+        if len(handles) > 1:
+            ax.legend(loc="upper center", bbox_to_anchor=(0.5, 1.12), ncol=2, fontsize=8, frameon=False)
+        elif ax.legend_:
+            ax.legend_.remove()
+    ax.tick_params(axis='x', labelsize=plotting.radar_label_fontsize(len(labels)), pad=6)
+    _align_polar_labels(ax)
+    fig.tight_layout(pad=1.0, rect=[0.02, 0.02, 0.98, 0.82])
+    return fig
+
+if not lod.aggregated:
+    cap_title = "Average score by Capability"
+elif RADAR_LOD_MODE == "variance":
+    cap_title = f"Average score by Capability (top {len(lod.labels)} by variance)"
+else:
+    cap_title = "Average score by Capability (grouped by Stage)"
+fig2 = _cap_radar(lod.labels, lod.series.get(product, []), cap_title, shared_size)
 _render_fig(fig2)
 
+drill_figs = []
+for stage_name, (d_labels, d_series) in lod.drilldowns.items():
+    drill_figs.append(_cap_radar(
+        d_labels, d_series.get(product, []), f"{stage_name}: score by Capability",
+        plotting.radar_size_for(len(d_labels)),
+    ))
+if drill_figs:
+    with st.expander("Capability drill-down by Stage", expanded=False):
+        for fig_d in drill_figs:
+            _render_fig(fig_d)
+
 # Build + download (spinner in the sidebar bottom)
 with st.sidebar:
     st.markdown("---")
@@ -127,6 +145,7 @@ with st.sidebar:
             responses=st.session_state.responses_all.get(product, {}),
             fig_stage=fig1,
             fig_cap=fig2,
+            drilldown_figs=drill_figs,
         )
         data = tmp_pdf.read()
 
@@ -141,3 +160,5 @@ with st.sidebar:
 # Cleanup
 plt.close(fig1)
 plt.close(fig2)
+for fig_d in drill_figs:
+    plt.close(fig_d)
@@ -9,8 +9,10 @@ This package contains:
 - scoring.py       → Convert responses to DataFrame with scores
 - formatting.py    → Text/Markdown report formatting
 - plotting.py      → Radar chart helpers
+- vega_charts.py   → Vega-Lite specs for client-side chart rendering
 - pdf_report.py    → PDF generation with charts and sections
 - widgets.py       → Streamlit form widgets for assessment
+- synthetic.py     → Synthetic catalogs/responses for benchmarks and load tests
 """
 
 from .constants import LEVELS, SUB_LEVELS, SUB_LEVEL_SCORES
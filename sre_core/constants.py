@@ -1,5 +1,22 @@
+import os
+
 LEVELS = ["Beginner", "Intermediate", "Advanced", "Expert", "Next-Gen (2025+)"]
 SUB_LEVELS = ["Not achieved", "Partially achieved", "Completed"]
 SUB_LEVEL_SCORES = {"Not achieved": 0.0, "Partially achieved": 0.5, "Completed": 1.0}
 REQUIRED_COLUMNS = ["Stage", "Capability"] + LEVELS
 DATA_FILE = "responses.json"
+
+# Chart rendering backend for the Visual Report: "matplotlib" renders PNGs on
+# the server, "vega-lite" ships compact JSON and lets the browser draw.
+CHART_BACKENDS = ("matplotlib", "vega-lite")
+CHART_BACKEND = os.environ.get("SRE_CHART_BACKEND", "matplotlib").strip().lower()
+
+# Radar level-of-detail: above this many capability spokes the radar is
+# aggregated ("stage" or "variance") with per-stage drill-down radars.
+RADAR_MAX_SPOKES = int(os.environ.get("SRE_RADAR_MAX_SPOKES", "48"))
+RADAR_LOD_MODE = os.environ.get("SRE_RADAR_LOD_MODE", "stage").strip().lower()
+
+# Timing spans (sre_core.instrumentation). Off by default; near-zero cost then.
+INSTRUMENTATION = os.environ.get("SRE_INSTRUMENT", "") == "1"
+PROFILER = os.environ.get("SRE_PROFILER", "").strip().lower()  # "", "cprofile", "pyinstrument"
+METRICS_FILE = os.environ.get("SRE_METRICS_FILE", "")  # Prometheus text dump, rewritten per rerun
@@ -1,6 +1,7 @@
 import pandas as pd
 import streamlit as st
 from .constants import REQUIRED_COLUMNS
+from .instrumentation import timed
 
 def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
     df = df.rename(columns={c: c.strip() for c in df.columns})
@@ -23,6 +24,7 @@ def _validate_columns(df: pd.DataFrame):
         raise ValueError(f"Missing columns: {missing}. Expected: {REQUIRED_COLUMNS}")
 
 @st.cache_data(show_spinner=False)
+@timed("data_io.load_capabilities")
 def load_capabilities(uploaded_or_path) -> pd.DataFrame:
     try:
         df = pd.read_csv(uploaded_or_path, sep=None, engine="python", dtype=str)
@@ -35,6 +37,7 @@ def load_capabilities(uploaded_or_path) -> pd.DataFrame:
     df = df.drop_duplicates(subset=["Stage","Capability"], keep="first").reset_index(drop=True)
     return df
 
+@timed("data_io.dataframe_to_items")
 def dataframe_to_items(df: pd.DataFrame):
     return [
         {
@@ -1,6 +1,8 @@
 from collections import OrderedDict
 from .constants import LEVELS
+from .instrumentation import timed
 
+@timed("formatting.markdown_report")
 def markdown_report(product: str, maturity_items, responses: dict) -> str:
     def md_line(s): return s + "  \n"  # hard line break
     stages = OrderedDict()
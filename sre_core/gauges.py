@@ -6,8 +6,11 @@ from typing import Dict, List, Tuple, Optional
 import matplotlib.pyplot as plt
 from matplotlib.patches import Wedge
 
+from .instrumentation import timed
+
 # ---------- Completion math (pure, no Streamlit) ----------
 
+@timed("gauges.stage_completion_from")
 def stage_completion_from(
     maturity_items: List[dict],
     responses_all: Dict[str, Dict[str, Dict[str, str]]],
@@ -33,6 +36,7 @@ def stage_completion_from(
         out[stage] = (done / total) if total else 0.0
     return out
 
+@timed("gauges.build_status_map")
 def build_status_map(
     maturity_items: List[dict],
     responses_product: Dict[str, Dict[str, str]],
@@ -95,6 +99,7 @@ def _half_donut(ax, pct: float, r: float = 1.0, width: float = 0.28) -> None:
     ax.set_aspect("equal", adjustable="box")
     ax.axis("off")
 
+@timed("gauges.grid_from_completion")
 def grid_from_completion(
     completion: Dict[str, float],
     cols: int = 5,
@@ -144,6 +149,7 @@ def grid_from_completion(
 
 # ---------- Ring chart (only label rotation adjusted) ----------
 
+@timed("gauges.ring_maturity_by_stage")
 def ring_maturity_by_stage(
     stages: List[str],
     levels: List[str],
@@ -1,6 +1,9 @@
 import io
+from typing import Optional
+
 import streamlit as st
-from sre_core import data_io, persistence
+from sre_core import data_io, persistence, instrumentation
+from sre_core.instrumentation import span
 
 DEFAULT_CAP_FILE = "Capabilities.csv"  # local fallback if you want it
 
@@ -9,17 +12,34 @@ def _set_page_config_once():
         st.set_page_config(page_title="SRE Maturity", layout="wide")
         st.session_state["_page_cfg_set"] = True
 
-def init_app(show_sidebar_controls: bool):
+def _session_id() -> str:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else "local"
+    except Exception:
+        return "local"
+
+def init_app(show_sidebar_controls: bool, page: Optional[str] = None):
     """
     Initialize shared state for every page.
     If show_sidebar_controls=True, render the CSV uploader and Product Management
     in the sidebar (Assessment page only). Other pages call with False so the
     sidebar stays clean.
+    `page` labels this rerun's timing tree when instrumentation is enabled.
     """
+    session = _session_id()
+    instrumentation.start_rerun(session, page or ("Assessment" if show_sidebar_controls else "Report"))
+    with span("init_app"):
+        _init_state(show_sidebar_controls)
+    instrumentation.debug_panel(session)
+
+def _init_state(show_sidebar_controls: bool):
     _set_page_config_once()
 
     # --- core session keys ---
-    st.session_state.setdefault("responses_all", persistence.load_responses())
+    with span("init_app.load_responses"):
+        st.session_state.setdefault("responses_all", persistence.load_responses())
     st.session_state.setdefault("cap_df", None)
     st.session_state.setdefault("uploaded_csv_content", None)
     st.session_state.setdefault("maturity_items", [])
@@ -33,16 +53,19 @@ def init_app(show_sidebar_controls: bool):
         if uploaded:
             # persist raw bytes so other pages can load without re-upload
             st.session_state.uploaded_csv_content = uploaded.getvalue()
-            st.session_state.cap_df = data_io.load_capabilities(uploaded)
+            with span("init_app.load_capabilities"):
+                st.session_state.cap_df = data_io.load_capabilities(uploaded)
         else:
             # If nothing uploaded yet but we have bytes from a prior session run, reuse them
             if st.session_state.uploaded_csv_content:
                 buf = io.BytesIO(st.session_state.uploaded_csv_content)
-                st.session_state.cap_df = data_io.load_capabilities(buf)
+                with span("init_app.load_capabilities"):
+                    st.session_state.cap_df = data_io.load_capabilities(buf)
             else:
                 # Optional local default
                 try:
-                    st.session_state.cap_df = data_io.load_capabilities(DEFAULT_CAP_FILE)
+                    with span("init_app.load_capabilities"):
+                        st.session_state.cap_df = data_io.load_capabilities(DEFAULT_CAP_FILE)
                     st.sidebar.info(f"Using local {DEFAULT_CAP_FILE}")
                 except Exception:
                     st.sidebar.warning("No capabilities loaded yet.")
@@ -92,7 +115,8 @@ def init_app(show_sidebar_controls: bool):
         # Just ensure we can reconstruct the capabilities DF if it exists in memory.
         if st.session_state.cap_df is None and st.session_state.uploaded_csv_content:
             buf = io.BytesIO(st.session_state.uploaded_csv_content)
-            st.session_state.cap_df = data_io.load_capabilities(buf)
+            with span("init_app.load_capabilities"):
+                st.session_state.cap_df = data_io.load_capabilities(buf)
 
         # If still None, leave it; the page should show a message to visit Assessment to upload.
         if st.session_state.cap_df is not None:
@@ -0,0 +1,258 @@
+# sre_core/instrumentation.py
+"""Lightweight timing spans for finding where a rerun spends its time.
+
+Disabled (the default) every `span()` is a shared no-op context manager and
+every `@timed` function is called straight through after one flag check.
+
+Enabled (SRE_INSTRUMENT=1 or `enable()`):
+- spans nest into a tree per rerun (`start_rerun` opens a new root per session)
+- totals per span name feed a Prometheus text dump (`write_metrics`,
+  automatically to SRE_METRICS_FILE when set)
+- an optional cProfile / pyinstrument capture covers each rerun
+- `debug_panel()` renders the last rerun's tree in the Streamlit sidebar
+"""
+from __future__ import annotations
+import contextlib
+import functools
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from .constants import INSTRUMENTATION, METRICS_FILE, PROFILER
+
+_NOOP = contextlib.nullcontext()
+_MAX_SESSIONS = 64
+
+class Span:
+    __slots__ = ("name", "start", "end", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+
+    @property
+    def seconds(self) -> float:
+        if self.end is not None:
+            return self.end - self.start
+        # open root: extent of what has been recorded so far
+        ends = [c.end for c in self.children if c.end is not None]
+        return (max(ends) - self.start) if ends else 0.0
+
+    def lines(self, depth: int = 0) -> List[str]:
+        out = [f"{'  ' * depth}{self.name}: {self.seconds * 1000:.1f} ms"]
+        for c in self.children:
+            out.extend(c.lines(depth + 1))
+        return out
+
+class _State:
+    def __init__(self, enabled: bool, profiler: str):
+        self.enabled = enabled
+        self.profiler = profiler  # "" | "cprofile" | "pyinstrument"
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.open: "OrderedDict[str, Span]" = OrderedDict()     # session -> running rerun root
+        self.last: "OrderedDict[str, Span]" = OrderedDict()     # session -> last finished rerun
+        self.profiles: "OrderedDict[str, object]" = OrderedDict()
+        self.profile_text: Dict[str, str] = {}
+        self.totals: Dict[str, List[float]] = {}                 # span -> [calls, seconds]
+        self.reruns: Dict[str, List[float]] = {}                 # page -> [count, seconds]
+
+_state = _State(INSTRUMENTATION, PROFILER)
+
+def enable(flag: bool = True, profiler: Optional[str] = None) -> None:
+    """Switch instrumentation (and optionally the per-rerun profiler) at runtime."""
+    _state.enabled = bool(flag)
+    if profiler is not None:
+        _state.profiler = profiler
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+def _stack() -> List[Span]:
+    st = getattr(_state.local, "stack", None)
+    if st is None:
+        st = _state.local.stack = []
+    return st
+
+def _record(name: str, seconds: float, table: Dict[str, List[float]]) -> None:
+    with _state.lock:
+        tot = table.setdefault(name, [0, 0.0])
+        tot[0] += 1
+        tot[1] += seconds
+
+@contextlib.contextmanager
+def _span(name: str):
+    sp = Span(name)
+    stack = _stack()
+    if stack:
+        stack[-1].children.append(sp)
+    stack.append(sp)
+    try:
+        yield sp
+    finally:
+        sp.end = time.perf_counter()
+        stack.pop()
+        _record(name, sp.end - sp.start, _state.totals)
+
+def span(name: str):
+    """Context manager timing the enclosed block as `name`."""
+    if not _state.enabled:
+        return _NOOP
+    return _span(name)
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator form of `span`; defaults to the function's qualified name."""
+    def deco(fn):
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            with _span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def _start_profiler():
+    if _state.profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            return None
+        prof = Profiler()
+        prof.start()
+        return prof
+    if _state.profiler == "cprofile":
+        import cProfile
+        prof = cProfile.Profile()
+        prof.enable()
+        return prof
+    return None
+
+def _stop_profiler(prof) -> str:
+    if hasattr(prof, "output_text"):  # pyinstrument
+        prof.stop()
+        return prof.output_text(unicode=False, color=False)
+    import pstats
+    prof.disable()
+    buf = io.StringIO()
+    pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(30)
+    return buf.getvalue()
+
+def _finish(session: str) -> None:
+    root = _state.open.pop(session, None)
+    prof = _state.profiles.pop(session, None)
+    if prof is not None:
+        try:
+            _state.profile_text[session] = _stop_profiler(prof)
+        except Exception:
+            pass
+    if root is None:
+        return
+    root.end = root.start + root.seconds
+    _state.last[session] = root
+    while len(_state.last) > _MAX_SESSIONS:
+        _state.profile_text.pop(_state.last.popitem(last=False)[0], None)
+    _record(root.name, root.end - root.start, _state.reruns)
+    if METRICS_FILE:
+        try:
+            write_metrics(METRICS_FILE)
+        except OSError:
+            pass
+
+def start_rerun(session: str, page: str) -> None:
+    """Close the session's previous rerun tree and open a new root for `page`.
+
+    Streamlit has no end-of-script hook, so a rerun is finalised when the next
+    one starts; its duration is the extent of the spans recorded under it.
+    """
+    if not _state.enabled:
+        return
+    with _state.lock:
+        _finish(session)
+        root = Span(page)
+        _state.open[session] = root
+        while len(_state.open) > _MAX_SESSIONS:
+            _state.open.popitem(last=False)
+        if _state.profiler:
+            prof = _start_profiler()
+            if prof is not None:
+                _state.profiles[session] = prof
+    stack = _stack()
+    stack.clear()
+    stack.append(root)
+
+def last_tree(session: str) -> Optional[Span]:
+    return _state.last.get(session)
+
+def current_tree(session: str) -> Optional[Span]:
+    return _state.open.get(session)
+
+def metrics_text() -> str:
+    """Span and rerun totals in Prometheus text exposition format."""
+    def esc(v: str) -> str:
+        return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    with _state.lock:
+        totals = {k: list(v) for k, v in _state.totals.items()}
+        reruns = {k: list(v) for k, v in _state.reruns.items()}
+    out = [
+        "# HELP sre_span_seconds_total Time spent inside instrumented spans.",
+        "# TYPE sre_span_seconds_total counter",
+    ]
+    out += [f'sre_span_seconds_total{{span="{esc(k)}"}} {v[1]:.6f}' for k, v in sorted(totals.items())]
+    out += ["# HELP sre_span_calls_total Number of times each span ran.", "# TYPE sre_span_calls_total counter"]
+    out += [f'sre_span_calls_total{{span="{esc(k)}"}} {int(v[0])}' for k, v in sorted(totals.items())]
+    out += ["# HELP sre_rerun_seconds Wall time of finished reruns per page.", "# TYPE sre_rerun_seconds summary"]
+    for k, v in sorted(reruns.items()):
+        out.append(f'sre_rerun_seconds_sum{{page="{esc(k)}"}} {v[1]:.6f}')
+        out.append(f'sre_rerun_seconds_count{{page="{esc(k)}"}} {int(v[0])}')
+    return "\n".join(out) + "\n"
+
+def write_metrics(path: str) -> None:
+    """Atomically replace `path` with the current metrics (scraper-safe)."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(metrics_text())
+    os.replace(tmp, path)
+
+def reset() -> None:
+    """Drop all recorded trees, profiles and totals (tests, long-lived workers)."""
+    with _state.lock:
+        _state.open.clear()
+        _state.last.clear()
+        _state.profiles.clear()
+        _state.profile_text.clear()
+        _state.totals.clear()
+        _state.reruns.clear()
+    _stack().clear()
+
+def debug_panel(session: str) -> None:
+    """Sidebar panel: last rerun's span tree, profiler toggle, metrics dump."""
+    if not _state.enabled:
+        return
+    import streamlit as st
+
+    with st.sidebar.expander("Performance (debug)", expanded=False):
+        tree = last_tree(session)
+        if tree is None:
+            st.caption("Timings appear after the next rerun.")
+        else:
+            st.code("\n".join(tree.lines()), language=None)
+        choice = st.selectbox(
+            "Profile each rerun", ["off", "cprofile", "pyinstrument"],
+            index=["", "cprofile", "pyinstrument"].index(_state.profiler or ""),
+            key="_instr_profiler",
+        )
+        _state.profiler = "" if choice == "off" else choice
+        text = _state.profile_text.get(session)
+        if text:
+            st.code(text[:20000], language=None)
+        if METRICS_FILE:
+            st.caption(f"Metrics: {METRICS_FILE}")
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from tempfile import NamedTemporaryFile
 from fpdf import FPDF
@@ -7,7 +7,8 @@ import re
 
 from .constants import LEVELS
 from .plotting import figure_to_image
-from .gauges import grid_from_completion, ring_maturity_by_stage, build_status_map  
+from .gauges import grid_from_completion, ring_maturity_by_stage, build_status_map
+from .instrumentation import span, timed
 REPLACEMENTS = {"—": "-", "–": "-", "\u00A0": " "}
 def _safe(s: str) -> str:
     if not isinstance(s, str):
@@ -56,12 +57,14 @@ def _wrap_multicell(pdf: FPDF, txt: str, h: float = 5):
     pdf.set_x(pdf.l_margin)
     pdf.multi_cell(w, h, safe)
 
+@timed("pdf_report.generate_pdf")
 def generate_pdf(
     product: str,
     maturity_items: List[dict],
     responses: Dict[str, Dict[str, str]],
     fig_stage,
     fig_cap,
+    drilldown_figs: Optional[List] = None,
 ):
     img_stage, _ = figure_to_image(fig_stage); img_stage.save("radar_stage.png")
     img_cap, _   = figure_to_image(fig_cap);   img_cap.save("radar_capability.png")
@@ -139,6 +142,23 @@ def generate_pdf(
     y += h1 + gap
     pdf.image("radar_capability.png", x=x, y=y, w=w_try)
 
+    # -------- Optional: per-stage capability drill-down radars, two per page --------
+    # (large catalogs: the capability radar above is aggregated, see plotting.radar_level_of_detail)
+    for i in range(0, len(drilldown_figs or []), 2):
+        pdf.add_page()
+        y = margin
+        for fig_d in drilldown_figs[i:i + 2]:
+            img_d, _ = figure_to_image(fig_d)
+            w_px, h_px = img_d.size
+            h_max = (usable_h - gap) / 2.0
+            w_d = usable_w
+            h_d = (h_px / w_px) * w_d if w_px else w_d
+            if h_d > h_max:
+                w_d *= h_max / h_d
+                h_d = h_max
+            pdf.image(img_d, x=margin + (usable_w - w_d) / 2.0, y=y, w=w_d)
+            y += h_d + gap
+
     # -------- Page 3: Donuts grid --------
     pdf.add_page()
     completion = _compute_stage_completion(maturity_items, responses)
@@ -197,11 +217,13 @@ def generate_pdf(
             pdf.cell(0, 6, txt="(none)", ln=True)
         pdf.ln(2)
 
-    section("Completed", ["Completed"])
-    section("Partially Achieved", ["Partially achieved"])
-    section("Not Achieved", ["Not achieved"])
+    with span("pdf_report.sections"):
+        section("Completed", ["Completed"])
+        section("Partially Achieved", ["Partially achieved"])
+        section("Not Achieved", ["Not achieved"])
 
     tmp = NamedTemporaryFile(delete=False, suffix=".pdf")
-    pdf.output(tmp.name)
+    with span("pdf_report.output"):
+        pdf.output(tmp.name)
     tmp.seek(0)
     return tmp
@@ -1,8 +1,13 @@
+from typing import Dict, List, NamedTuple, Tuple
+
 import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 from PIL import Image
 
+from .constants import RADAR_MAX_SPOKES
+from .instrumentation import timed
+
 def plot_radar(ax, labels, values, label=None, y_max=5):
     angles = np.linspace(0, 2*np.pi, len(labels), endpoint=False).tolist()
     angles += angles[:1]
@@ -13,6 +18,88 @@ def plot_radar(ax, labels, values, label=None, y_max=5):
     ax.set_xticklabels(labels)
     ax.set_ylim(0, y_max)
 
+def radar_size_for(n_spokes: int) -> float:
+    """Figure size (inches) for a radar with `n_spokes` labels."""
+    n = max(1, n_spokes)
+    return 7.5 if n <= 24 else 9.5 if n <= 48 else 12.5 if n <= 80 else 14.0
+
+def radar_label_fontsize(n_spokes: int) -> int:
+    """Tick label size that keeps `n_spokes` labels legible."""
+    n = max(1, n_spokes)
+    return 9 if n <= 12 else 8 if n <= 24 else 7 if n <= 36 else 6 if n <= 60 else 5
+
+class RadarLOD(NamedTuple):
+    """Level-of-detail plan for a capability radar.
+
+    labels/series: the overview radar (never more than `max_spokes` spokes)
+    aggregated:    True when the overview no longer has one spoke per capability
+    drilldowns:    stage -> (labels, series) for per-stage radars, each capped too
+    """
+    labels: List[str]
+    series: Dict[str, List[float]]
+    aggregated: bool
+    drilldowns: Dict[str, Tuple[List[str], Dict[str, List[float]]]]
+
+def _top_variance(labels: List[str], mat: np.ndarray, n: int) -> List[int]:
+    """Column indices of the `n` most spread-out labels, in label order.
+
+    Spread is the variance across series; with a single series (or ties) the
+    lowest-scoring labels win, i.e. the biggest gaps stay visible.
+    """
+    if len(labels) <= n:
+        return list(range(len(labels)))
+    var = mat.var(axis=0) if mat.shape[0] > 1 else np.zeros(mat.shape[1])
+    mean = mat.mean(axis=0) if mat.shape[0] else np.zeros(mat.shape[1])
+    # lexsort: last key is primary → variance desc, then mean asc
+    order = np.lexsort((mean, -var))[:n]
+    return sorted(order.tolist())
+
+def radar_level_of_detail(
+    labels: List[str],
+    series: Dict[str, List[float]],
+    stage_of: Dict[str, str],
+    max_spokes: int = RADAR_MAX_SPOKES,
+    mode: str = "stage",
+) -> RadarLOD:
+    """Bound a capability radar to at most `max_spokes` spokes.
+
+    At or below the limit the input is returned unchanged. Above it the
+    overview either averages capabilities per stage (`mode="stage"`) or keeps
+    the top-N capabilities by variance across series (`mode="variance"`), and
+    per-stage drill-down radars are prepared for the detail.
+    """
+    max_spokes = max(3, int(max_spokes))
+    if len(labels) <= max_spokes:
+        return RadarLOD(list(labels), dict(series), False, {})
+
+    names = list(series)
+    mat = np.asarray([series[n] for n in names], dtype=float).reshape(len(names), len(labels))
+    stages = sorted({stage_of.get(lab, "") for lab in labels})
+    cols_by_stage = {s: [i for i, lab in enumerate(labels) if stage_of.get(lab, "") == s] for s in stages}
+
+    if mode == "variance":
+        keep = _top_variance(labels, mat, max_spokes)
+        ov_labels = [labels[i] for i in keep]
+        ov_mat = mat[:, keep]
+    else:
+        stage_mat = np.column_stack([mat[:, cols_by_stage[s]].mean(axis=1) for s in stages])
+        keep = _top_variance(stages, stage_mat, max_spokes)
+        ov_labels = [stages[i] for i in keep]
+        ov_mat = stage_mat[:, keep]
+
+    drill = {}
+    for s in stages:
+        cols = cols_by_stage[s]
+        sub = mat[:, cols]
+        keep = _top_variance([labels[i] for i in cols], sub, max_spokes)
+        drill[s] = (
+            [labels[cols[i]] for i in keep],
+            {n: sub[k, keep].tolist() for k, n in enumerate(names)},
+        )
+    ov_series = {n: ov_mat[k].tolist() for k, n in enumerate(names)}
+    return RadarLOD(ov_labels, ov_series, True, drill)
+
+@timed("plotting.figure_to_image")
 def figure_to_image(fig):
     buf = BytesIO()
     fig.savefig(buf, format="png", bbox_inches="tight")
@@ -1,8 +1,12 @@
+from typing import Dict, List, Tuple
+
 import pandas as pd
 import streamlit as st
 from .constants import LEVELS, SUB_LEVEL_SCORES
+from .instrumentation import timed
 
 @st.cache_data(show_spinner=False)
+@timed("scoring.build_df")
 def build_df(maturity_items, responses_all: dict) -> pd.DataFrame:
     rows = []
     for prod, answers in responses_all.items():
@@ -15,3 +19,17 @@ def build_df(maturity_items, responses_all: dict) -> pd.DataFrame:
                 row[lvl] = statuses.get(lvl, "Not achieved")
             rows.append(row)
     return pd.DataFrame(rows)
+
+def radar_series(df: pd.DataFrame, by: str) -> Tuple[List[str], Dict[str, List[float]]]:
+    """Mean score per `by` label (Stage or Capability) for each product.
+
+    Returns sorted labels plus one value list per product aligned to them, so
+    every chart backend draws from the same numbers.
+    """
+    if df.empty:
+        return [], {}
+    means = df.groupby(["Product", by])["Score"].mean().unstack(by)
+    labels = sorted(means.columns.tolist())
+    means = means.reindex(columns=labels).fillna(0.0)
+    series = {prod: [float(v) for v in row] for prod, row in zip(means.index, means.to_numpy())}
+    return labels, series
@@ -0,0 +1,54 @@
+# sre_core/synthetic.py
+"""Synthetic catalogs and responses for benchmarks and load tests.
+
+Deterministic for a given seed, no I/O. Items have the same shape as
+`data_io.dataframe_to_items` output; responses the same shape as
+`persistence.load_responses`.
+"""
+from __future__ import annotations
+import random
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .constants import LEVELS, SUB_LEVELS
+
+_WORDS = (
+    "automated pipeline alerting runbook capacity rollout canary tracing "
+    "budget incident review chaos resilience observability policy drift "
+    "backup restore latency quota failover dashboard ownership toil"
+).split()
+
+def make_catalog(n_caps: int, n_stages: Optional[int] = None, seed: int = 0) -> List[dict]:
+    """`n_caps` capability items spread round-robin over `n_stages` stages."""
+    rnd = random.Random(seed)
+    n_stages = n_stages or min(12, max(2, n_caps // 6))
+    items = []
+    for i in range(n_caps):
+        item = {"Stage": f"Stage {i % n_stages:02d}", "Capability": f"Capability {i:05d}"}
+        for lvl in LEVELS:
+            item[lvl] = " ".join(rnd.choice(_WORDS) for _ in range(rnd.randint(8, 24)))
+        items.append(item)
+    return items
+
+def make_catalog_df(n_caps: int, n_stages: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """Same as `make_catalog`, as a DataFrame with the CSV columns."""
+    return pd.DataFrame(make_catalog(n_caps, n_stages, seed))
+
+def make_responses(
+    items: List[dict],
+    n_products: int,
+    answered: float = 0.7,
+    seed: int = 0,
+) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Responses for `n_products`; roughly `answered` of the cells are set."""
+    rnd = random.Random(seed)
+    out: Dict[str, Dict[str, Dict[str, str]]] = {}
+    for p in range(n_products):
+        prod: Dict[str, Dict[str, str]] = {}
+        for it in items:
+            levels = {lvl: rnd.choice(SUB_LEVELS) for lvl in LEVELS if rnd.random() < answered}
+            if levels:
+                prod[it["Capability"]] = levels
+        out[f"Product {p:04d}"] = prod
+    return out
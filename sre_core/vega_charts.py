@@ -0,0 +1,225 @@
+# sre_core/vega_charts.py
+"""Vega-Lite specs for the Visual Report charts (client-side rendering).
+
+Each builder takes the same data the Matplotlib helpers use (radar series from
+`scoring.radar_series`, completion from `gauges.stage_completion_from`, the
+tri-state map from `gauges.build_status_map`) and returns a plain dict spec
+with compact inline rows. The browser does the drawing, so resizing and
+hovering cost no server work.
+"""
+from __future__ import annotations
+import math
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA_URL = "https://vega.github.io/schema/vega-lite/v5.json"
+
+def _donut_color(pct: float) -> str:
+    # same thresholds as gauges._half_donut
+    return "#d9534f" if pct < 0.4 else ("#f0ad4e" if pct < 0.8 else "#5cb85c")
+
+def radar_spec(
+    labels: List[str],
+    series: Dict[str, List[float]],
+    y_max: float,
+    title: str = "",
+    size: int = 520,
+) -> dict:
+    """Radar chart: one closed polygon per series over `labels` spokes.
+
+    Only (series, spoke index, value) rows plus the label list are shipped;
+    polar → cartesian projection happens in Vega transforms.
+    """
+    n = max(1, len(labels))
+    rows = []
+    for name, vals in series.items():
+        for i, v in enumerate(vals):
+            rows.append({"s": name, "i": i, "v": round(float(v), 3)})
+        if vals:
+            # close the polygon
+            rows.append({"s": name, "i": len(vals), "v": round(float(vals[0]), 3)})
+    spokes = [{"i": i, "l": lab} for i, lab in enumerate(labels)]
+    grid = [{"g": g, "i": i} for g in range(1, int(math.ceil(y_max)) + 1) for i in range(n + 1)]
+
+    ang = f"2 * PI * datum.i / {n}"
+    scale = {"domain": [-y_max * 1.25, y_max * 1.25]}
+
+    def xy(r: str) -> List[dict]:
+        # spoke 0 points up, clockwise like the Matplotlib radar reads
+        return [
+            {"calculate": f"({r}) * sin({ang})", "as": "x"},
+            {"calculate": f"({r}) * cos({ang})", "as": "y"},
+        ]
+
+    axis_off = {"axis": None}
+
+    layers = [
+        {
+            "data": {"values": grid},
+            "transform": xy("datum.g"),
+            "mark": {"type": "line", "color": "#dddddd", "strokeWidth": 0.8},
+            "encoding": {
+                "x": {"field": "x", "type": "quantitative", "scale": scale, **axis_off},
+                "y": {"field": "y", "type": "quantitative", "scale": scale, **axis_off},
+                "detail": {"field": "g"},
+                "order": {"field": "i"},
+            },
+        },
+        {
+            "data": {"values": spokes},
+            "transform": xy(str(y_max * 1.08)),
+            "mark": {"type": "text", "fontSize": 9 if n <= 24 else 7, "color": "#333333"},
+            "encoding": {
+                "x": {"field": "x", "type": "quantitative", "scale": scale, **axis_off},
+                "y": {"field": "y", "type": "quantitative", "scale": scale, **axis_off},
+                "text": {"field": "l"},
+            },
+        },
+        {
+            "data": {"values": rows},
+            "transform": xy("datum.v") + [
+                {"lookup": "i", "from": {"data": {"values": spokes}, "key": "i", "fields": ["l"]}},
+            ],
+            "mark": {"type": "line", "point": True, "strokeWidth": 1.5},
+            "encoding": {
+                "x": {"field": "x", "type": "quantitative", "scale": scale, **axis_off},
+                "y": {"field": "y", "type": "quantitative", "scale": scale, **axis_off},
+                "color": {
+                    "field": "s", "type": "nominal", "title": None,
+                    "legend": {"orient": "top"} if len(series) > 1 else None,
+                },
+                "order": {"field": "i"},
+                "tooltip": [
+                    {"field": "s", "title": "Series"},
+                    {"field": "l", "title": "Label"},
+                    {"field": "v", "title": "Score"},
+                ],
+            },
+        },
+    ]
+    return {
+        "$schema": SCHEMA_URL,
+        "title": title,
+        "width": size,
+        "height": size,
+        "layer": layers,
+        "config": {"view": {"stroke": None}},
+    }
+
+def donut_grid_spec(
+    completion: Dict[str, float],
+    cols: int = 5,
+    title: str = "Stage Completion Overview",
+    cell: int = 150,
+) -> dict:
+    """Half-donut per stage, faceted in a grid (mirrors `gauges.grid_from_completion`)."""
+    rows = []
+    for stage in sorted(completion):
+        pct = max(0.0, min(1.0, float(completion[stage])))
+        rows.append({"stage": stage, "part": 0, "v": pct, "c": _donut_color(pct), "pct": pct})
+        rows.append({"stage": stage, "part": 1, "v": 1.0 - pct, "c": "#eeeeee", "pct": pct})
+    return {
+        "$schema": SCHEMA_URL,
+        "title": title,
+        "data": {"values": rows},
+        "facet": {"field": "stage", "type": "nominal", "title": None, "sort": None},
+        "columns": max(1, cols),
+        "spec": {
+            "width": cell,
+            "height": cell // 2 + 10,
+            "layer": [
+                {
+                    "mark": {"type": "arc", "innerRadius": cell * 0.26, "outerRadius": cell * 0.45},
+                    "encoding": {
+                        "theta": {
+                            "field": "v", "type": "quantitative", "stack": True,
+                            "scale": {"range": [-math.pi / 2, math.pi / 2]},
+                        },
+                        "order": {"field": "part"},
+                        "color": {"field": "c", "type": "nominal", "scale": None},
+                        "tooltip": [
+                            {"field": "stage", "title": "Stage"},
+                            {"field": "pct", "title": "Completed", "format": ".1%"},
+                        ],
+                    },
+                },
+                {
+                    "transform": [{"filter": "datum.part == 0"}],
+                    "mark": {"type": "text", "fontSize": 12, "dy": 10},
+                    "encoding": {"text": {"field": "pct", "type": "quantitative", "format": ".1%"}},
+                },
+            ],
+        },
+        "config": {"view": {"stroke": None}},
+    }
+
+def ring_spec(
+    stages: List[str],
+    levels: List[str],
+    status_map: Dict[Tuple[str, str], str],
+    title: Optional[str] = "Identification of the degree of the implementation (Maturity by Stage)",
+    size: int = 560,
+    colors: Tuple[str, str] = ("#2094f3", "#eaeaea"),
+) -> dict:
+    """Sunburst-like ring (mirrors `gauges.ring_maturity_by_stage`).
+
+    Band geometry is precomputed here in radians/pixels so the client only
+    draws arcs; status drives colour and opacity.
+    """
+    n = max(1, len(stages))
+    gap = 2 * math.pi * 0.02
+    sector = 2 * math.pi / n - gap
+    r_outer = size * 0.36
+    r_inner = r_outer * 0.45
+    band = (r_outer - r_inner) / max(1, len(levels))
+    bands, labels = [], []
+    for i, stage in enumerate(stages):
+        t0 = i * (sector + gap)
+        for li, lvl in enumerate(levels):
+            status = status_map.get((stage, lvl), "not")
+            bands.append({
+                "stage": stage, "level": lvl, "status": status,
+                "t0": round(t0, 4), "t1": round(t0 + sector, 4),
+                "r0": round(r_inner + li * band + 1, 1), "r1": round(r_inner + (li + 1) * band - 1, 1),
+            })
+        labels.append({"stage": stage, "t": round(t0 + sector / 2, 4), "r": round(r_outer + 18, 1)})
+    return {
+        "$schema": SCHEMA_URL,
+        "title": title or "",
+        "width": size,
+        "height": size,
+        "layer": [
+            {
+                "data": {"values": bands},
+                "mark": {"type": "arc", "stroke": "white", "strokeWidth": 1},
+                "encoding": {
+                    "theta": {"field": "t0", "type": "quantitative", "scale": None},
+                    "theta2": {"field": "t1"},
+                    "radius": {"field": "r0", "type": "quantitative", "scale": None},
+                    "radius2": {"field": "r1"},
+                    "color": {
+                        "condition": {"test": "datum.status === 'not'", "value": colors[1]},
+                        "value": colors[0],
+                    },
+                    "opacity": {
+                        "condition": {"test": "datum.status === 'partial'", "value": 0.35},
+                        "value": 1.0,
+                    },
+                    "tooltip": [
+                        {"field": "stage", "title": "Stage"},
+                        {"field": "level", "title": "Level"},
+                        {"field": "status", "title": "Status"},
+                    ],
+                },
+            },
+            {
+                "data": {"values": labels},
+                "mark": {"type": "text", "fontSize": 12, "color": "#222222"},
+                "encoding": {
+                    "theta": {"field": "t", "type": "quantitative", "scale": None},
+                    "radius": {"field": "r", "type": "quantitative", "scale": None},
+                    "text": {"field": "stage"},
+                },
+            },
+        ],
+        "config": {"view": {"stroke": None}},
+    }
@@ -0,0 +1,156 @@
+"""Performance benchmarks for the sre_core pipeline.
+
+Opt-in (they are slow): SRE_BENCH=1 pytest tests/benchmarks -q
+
+Environment knobs:
+- SRE_BENCH_SIZES      comma list of size names (default "small,medium")
+- SRE_BENCH_THRESHOLD  allowed slowdown / memory growth factor (default 2.0)
+- SRE_BENCH_UPDATE=1   rewrite baselines.json from this run instead of comparing
+
+Each case records the best wall time over a few repeats and the peak
+tracemalloc memory of one extra run, then compares both with baselines.json.
+Everything is generated in-process (sre_core.synthetic), no network needed.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from sre_core import scoring, formatting, pdf_report, synthetic
+from sre_core.constants import LEVELS
+from sre_core.gauges import stage_completion_from, build_status_map, ring_maturity_by_stage
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(os.environ.get("SRE_BENCH") != "1", reason="set SRE_BENCH=1 to run benchmarks"),
+]
+
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+THRESHOLD = float(os.environ.get("SRE_BENCH_THRESHOLD", "2.0"))
+UPDATE = os.environ.get("SRE_BENCH_UPDATE") == "1"
+# noise floors: tiny timings/allocations jitter far more than THRESHOLD
+MIN_SECONDS = 0.005
+MIN_PEAK_KIB = 256
+
+# name -> (products, capabilities, timing repeats)
+SIZES = {
+    "small": (10, 50, 5),
+    "medium": (100, 300, 3),
+    "large": (1000, 2000, 1),
+}
+SELECTED = [s.strip() for s in os.environ.get("SRE_BENCH_SIZES", "small,medium").split(",") if s.strip()]
+
+_results = {}
+
+@pytest.fixture(scope="module", params=SELECTED)
+def dataset(request):
+    n_products, n_caps, repeats = SIZES[request.param]
+    items = synthetic.make_catalog(n_caps)
+    responses_all = synthetic.make_responses(items, n_products)
+    product = next(iter(responses_all))
+    return request.param, items, responses_all, product, repeats
+
+def _measure(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak / 1024.0
+
+def _load_baselines():
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE) as f:
+        return json.load(f)
+
+def _check(key, seconds, peak_kib):
+    _results[key] = {"seconds": round(seconds, 5), "peak_kib": round(peak_kib, 1)}
+    if UPDATE:
+        return
+    base = _load_baselines().get(key)
+    if not base:
+        pytest.skip(f"no baseline for {key}; run with SRE_BENCH_UPDATE=1")
+    if seconds > max(base["seconds"], MIN_SECONDS) * THRESHOLD:
+        pytest.fail(f"{key}: {seconds:.4f}s vs baseline {base['seconds']:.4f}s (> x{THRESHOLD})")
+    if peak_kib > max(base["peak_kib"], MIN_PEAK_KIB) * THRESHOLD:
+        pytest.fail(f"{key}: peak {peak_kib:.0f} KiB vs baseline {base['peak_kib']:.0f} KiB (> x{THRESHOLD})")
+
+@pytest.fixture(scope="module", autouse=True)
+def _write_baselines():
+    yield
+    if UPDATE and _results:
+        merged = _load_baselines()
+        merged.update(_results)
+        with open(BASELINES_FILE, "w") as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+            f.write("\n")
+
+def test_bench_build_df(dataset):
+    size, items, responses_all, _product, repeats = dataset
+    build = scoring.build_df.__wrapped__  # bypass st.cache_data: measure the real work
+    _check(f"{size}::build_df", *_measure(lambda: build(items, responses_all), repeats))
+
+def test_bench_stage_completion_from(dataset):
+    size, items, responses_all, product, repeats = dataset
+    _check(
+        f"{size}::stage_completion_from",
+        *_measure(lambda: stage_completion_from(items, responses_all, product, LEVELS), repeats),
+    )
+
+def test_bench_build_status_map(dataset):
+    size, items, responses_all, product, repeats = dataset
+    _check(
+        f"{size}::build_status_map",
+        *_measure(lambda: build_status_map(items, responses_all[product], LEVELS), repeats),
+    )
+
+def test_bench_markdown_report(dataset):
+    size, items, responses_all, product, repeats = dataset
+    _check(
+        f"{size}::markdown_report",
+        *_measure(lambda: formatting.markdown_report(product, items, responses_all[product]), repeats),
+    )
+
+def test_bench_ring_maturity_by_stage(dataset):
+    size, items, responses_all, product, repeats = dataset
+    smap = build_status_map(items, responses_all[product], LEVELS)
+    stages = sorted({it["Stage"] for it in items})
+
+    def run():
+        plt.close(ring_maturity_by_stage(stages, LEVELS, status_map=smap, figsize=(6, 6)))
+
+    _check(f"{size}::ring_maturity_by_stage", *_measure(run, repeats))
+
+def test_bench_generate_pdf(dataset, tmp_path, monkeypatch):
+    size, items, responses_all, product, repeats = dataset
+    monkeypatch.chdir(tmp_path)  # generate_pdf writes its PNGs to the CWD
+    fig1, _ = plt.subplots(figsize=(2, 2), subplot_kw=dict(polar=True))
+    fig2, _ = plt.subplots(figsize=(2, 2), subplot_kw=dict(polar=True))
+
+    def run():
+        before = set(plt.get_fignums())
+        tmp = pdf_report.generate_pdf(product, items, responses_all[product], fig1, fig2)
+        tmp.close()
+        os.unlink(tmp.name)
+        for num in set(plt.get_fignums()) - before:  # ring + donuts made inside
+            plt.close(num)
+
+    _check(f"{size}::generate_pdf", *_measure(run, min(repeats, 2)))
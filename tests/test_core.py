@@ -127,3 +127,82 @@ def test_figure_to_image_and_pdf(tmp_path):
     p = tmp.name
     stat = os.stat(p)
     assert stat.st_size > 0
+
+def test_radar_series_and_vega_specs():
+    from sre_core import vega_charts
+    items, responses_all = sample_data()
+    df = scoring.build_df(items, responses_all)
+    labels, series = scoring.radar_series(df, "Stage")
+    assert labels == ["Build", "Deploy"]
+    assert series["ProductA"] == [1.5, 1.0]
+
+    spec = vega_charts.radar_spec(labels, series, len(LEVELS), "Average score by Stage")
+    rows = spec["layer"][-1]["data"]["values"]
+    # one row per spoke plus the closing point
+    assert len(rows) == len(labels) + 1 and rows[0]["v"] == rows[-1]["v"]
+
+    donut = vega_charts.donut_grid_spec({"Build": 0.6, "Deploy": 0.2}, cols=2)
+    assert {r["c"] for r in donut["data"]["values"] if r["part"] == 0} == {"#f0ad4e", "#d9534f"}
+
+    smap = build_status_map(items, responses_all["ProductA"], LEVELS)
+    ring = vega_charts.ring_spec(["Build", "Deploy"], LEVELS, smap)
+    bands = ring["layer"][0]["data"]["values"]
+    assert len(bands) == 2 * len(LEVELS)
+    assert {b["status"] for b in bands if b["stage"] == "Build" and b["level"] == LEVELS[0]} == {"completed"}
+
+def test_radar_level_of_detail_bounds_spokes(tmp_path):
+    from sre_core.plotting import radar_level_of_detail, plot_radar
+    labels = [f"Cap{i:03d}" for i in range(120)]
+    stage_of = {lab: f"Stage{i % 6}" for i, lab in enumerate(labels)}
+    series = {"A": [float(i % 5) for i in range(120)], "B": [1.0] * 120}
+
+    small = radar_level_of_detail(labels[:10], {k: v[:10] for k, v in series.items()}, stage_of, max_spokes=20)
+    assert not small.aggregated and small.labels == labels[:10]
+
+    by_stage = radar_level_of_detail(labels, series, stage_of, max_spokes=12, mode="stage")
+    assert by_stage.aggregated
+    assert by_stage.labels == [f"Stage{i}" for i in range(6)]
+    assert set(by_stage.drilldowns) == set(by_stage.labels)
+    assert all(len(lbls) <= 12 for lbls, _ in by_stage.drilldowns.values())
+
+    by_var = radar_level_of_detail(labels, series, stage_of, max_spokes=12, mode="variance")
+    assert len(by_var.labels) == 12 and len(by_var.series["A"]) == 12
+
+    # drill-down radars go into the PDF without issue
+    items, responses_all = sample_data()
+    figs = []
+    for lbls, ser in list(by_stage.drilldowns.values())[:3]:
+        fig, ax = plt.subplots(figsize=(2, 2), subplot_kw=dict(polar=True))
+        plot_radar(ax, lbls, ser["A"])
+        figs.append(fig)
+    fig1, _ = plt.subplots(figsize=(2, 2), subplot_kw=dict(polar=True))
+    fig2, _ = plt.subplots(figsize=(2, 2), subplot_kw=dict(polar=True))
+    tmp = pdf_report.generate_pdf("ProductA", items, responses_all["ProductA"], fig1, fig2, drilldown_figs=figs)
+    assert os.path.getsize(tmp.name) > 0
+
+def test_instrumentation_spans_and_metrics(tmp_path):
+    from sre_core import instrumentation as instr
+    instr.reset()
+    instr.enable(False)
+    assert instr.span("x") is instr.span("y")  # shared no-op when disabled
+    try:
+        instr.enable(True)
+        instr.start_rerun("s1", "Visual Report")
+        with instr.span("outer"):
+            items, responses_all = sample_data()
+            build_status_map(items, responses_all["ProductA"], LEVELS)
+        instr.start_rerun("s1", "Visual Report")  # closes the first rerun
+        tree = instr.last_tree("s1")
+        assert tree.name == "Visual Report"
+        assert tree.children[0].name == "outer"
+        assert tree.children[0].children[0].name == "gauges.build_status_map"
+
+        text = instr.metrics_text()
+        assert 'sre_span_calls_total{span="gauges.build_status_map"} 1' in text
+        assert 'sre_rerun_seconds_count{page="Visual Report"} 1' in text
+        out = tmp_path / "metrics.prom"
+        instr.write_metrics(str(out))
+        assert out.read_text() == text
+    finally:
+        instr.enable(False)
+        instr.reset()